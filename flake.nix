@@ -14,6 +14,11 @@
 
         python-env = pkgs.python313.withPackages (ps: with ps; [
           reportlab
+          httpx
+          h2
+          tenacity
+          ijson
+          orjson
         ]);
 
         env = pkgs.mkShell
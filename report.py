@@ -1,21 +1,32 @@
 #!/usr/bin/env python3
 
 import argparse
+import asyncio
+import functools
 import json
+import mmap
 import os
 import re
+import shutil
 import sys
 import time
-import urllib.parse
-import urllib.request
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
 
+import httpx
+import ijson
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential, wait_random
 from reportlab.lib.pagesizes import letter, landscape
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
 from reportlab.lib.units import inch
-from xml.sax.saxutils import escape as xml_escape
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 BASE = "https://www.layahealthcare.ie/api"
@@ -27,16 +38,90 @@ URL_PLANSUMMARY = f"{BASE}/plans/plans/plansummary.json"
 CACHE_DIR = ".cache"
 CACHE_MAX_AGE_SECONDS = 7 * 24 * 60 * 60  # 1 week
 
-
-def http_get_json(url: str, params: dict | None = None, timeout: int = 30):
-    if params:
-        qs = urllib.parse.urlencode(params)
-        url = f"{url}?{qs}"
-    req = urllib.request.Request(url, headers={"User-Agent": "laya-pdf/1.0"})
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        charset = resp.headers.get_content_charset() or "utf-8"
-        data = resp.read().decode(charset)
-        return json.loads(data)
+# Max consultant searches in flight at once in --all mode
+BATCH_FETCH_CONCURRENCY = 8
+
+# Returned by http_get_json when a conditional request gets a 304
+NOT_MODIFIED = object()
+
+
+# JSON goes through orjson when it is installed; both helpers work on bytes
+if orjson is not None:
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+else:
+    json_loads = json.loads
+
+    def json_dumps(data) -> bytes:
+        return json.dumps(data).encode("utf-8")
+
+
+class ChunkReader:
+    """Async file-like reader over a stream of byte chunks, as ijson expects.
+
+    Everything read is also written to sink when one is given.
+    """
+
+    def __init__(self, chunks, sink=None):
+        self.chunks = aiter(chunks)
+        self.sink = sink
+
+    async def read(self, n: int = -1) -> bytes:
+        # ijson calls read(0) to probe for bytes vs str
+        if n == 0:
+            return b""
+        # An empty chunk would read as EOF, so skip any the transport yields
+        async for chunk in self.chunks:
+            if chunk:
+                if self.sink is not None:
+                    self.sink.write(chunk)
+                return chunk
+        return b""
+
+
+def is_transient_http_error(exc: BaseException) -> bool:
+    # 4xx won't go away by asking again; only retry server errors and network failures
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=0.5, max=4) + wait_random(0, 0.5),
+    retry=retry_if_exception(is_transient_http_error),
+    reraise=True,
+)
+async def http_get_json(client: httpx.AsyncClient, url: str, params: dict | None = None, timeout: int = 30, stream_key: str | None = None, tee=None, validators: dict | None = None):
+    # Returns (data, validators); data is NOT_MODIFIED when the server answers
+    # a conditional request (made from the given validators) with a 304
+    headers = {}
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+    async with client.stream("GET", url, params=params, headers=headers, timeout=timeout) as resp:
+        if resp.status_code == 304:
+            return NOT_MODIFIED, validators
+        resp.raise_for_status()
+        new_validators = {
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+        }
+        if stream_key is None:
+            # Parse the raw body: the API does not always label its responses
+            # as application/json, and this skips decoding to str first
+            return json_loads(await resp.aread()), new_validators
+        # Parse incrementally so only the items under stream_key are ever
+        # materialized, optionally copying the raw body into tee as it arrives
+        if tee is not None:
+            # Drop whatever a previous (retried) attempt left behind
+            tee.seek(0)
+            tee.truncate()
+        stream = ChunkReader(resp.aiter_bytes(), tee)
+        items = [item async for item in ijson.items(stream, stream_key, use_float=True)]
+        return items, new_validators
 
 
 def ensure_cache_dir():
@@ -50,66 +135,186 @@ def cache_path(name: str) -> str:
     return os.path.join(CACHE_DIR, name)
 
 
-def load_cache_if_fresh(name: str, max_age_seconds: int = CACHE_MAX_AGE_SECONDS):
+@functools.lru_cache(maxsize=128)
+def fresh_cache_path(name: str, max_age_seconds: int) -> str | None:
+    # A run is short next to the TTL, so the stat is done once per process;
+    # anything that rewrites or touches a cache file must call cache_clear()
     path = cache_path(name)
-    if os.path.exists(path):
+    try:
+        age = time.time() - os.path.getmtime(path)
+    except OSError:
+        return None
+    return path if age <= max_age_seconds else None
+
+
+def load_cache_if_fresh(name: str, max_age_seconds: int = CACHE_MAX_AGE_SECONDS, stream_key: str | None = None):
+    path = fresh_cache_path(name, max_age_seconds)
+    if path is not None:
         try:
-            age = time.time() - os.path.getmtime(path)
-            if age <= max_age_seconds:
-                with open(path, "r") as f:
-                    return json.load(f)
+            return load_local_json(path, stream_key)
         except Exception:
             return None
     return None
 
 
-def save_cache_json(name: str, data):
+def save_cache_json(name: str, data, validators: dict | None = None):
     ensure_cache_dir()
     path = cache_path(name)
     tmp = path + ".tmp"
-    with open(tmp, "w") as f:
-        json.dump(data, f)
+    with open(tmp, "wb") as f:
+        f.write(json_dumps(data))
+    os.replace(tmp, path)
+    fresh_cache_path.cache_clear()
+    save_cache_validators(name, validators)
+
+
+def load_cache_validators(name: str) -> dict:
+    # ETag / Last-Modified of the cached response, kept in a sibling .meta file
+    try:
+        return load_local_json(cache_path(name) + ".meta")
+    except Exception:
+        return {}
+
+
+def save_cache_validators(name: str, validators: dict | None):
+    path = cache_path(name) + ".meta"
+    if not validators or not any(validators.values()):
+        # Never keep validators that belong to a different body
+        if os.path.exists(path):
+            os.remove(path)
+        return
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(json_dumps(validators))
     os.replace(tmp, path)
 
 
-def fetch_json_with_cache(name: str, url: str, params: dict | None = None, max_age_seconds: int = CACHE_MAX_AGE_SECONDS, local_fallbacks: list[str] | None = None):
+async def fetch_json_with_cache(client: httpx.AsyncClient, name: str, url: str, params: dict | None = None, max_age_seconds: int = CACHE_MAX_AGE_SECONDS, local_fallbacks: list[str] | None = None, stream_key: str | None = None):
+    # With stream_key only the items under that ijson prefix are returned,
+    # while the cache always keeps the whole document as served
     # Return fresh cache if available
-    cached = load_cache_if_fresh(name, max_age_seconds)
+    cached = load_cache_if_fresh(name, max_age_seconds, stream_key)
     if cached is not None:
         return cached
-    # Try remote
+    # Try remote, revalidating a stale cache entry if there is one
+    path = cache_path(name)
+    validators = load_cache_validators(name) if os.path.exists(path) else None
     try:
-        data = http_get_json(url, params)
-        save_cache_json(name, data)
+        if stream_key is None:
+            data, validators = await http_get_json(client, url, params, validators=validators)
+            if data is not NOT_MODIFIED:
+                save_cache_json(name, data, validators)
+        else:
+            ensure_cache_dir()
+            tmp = path + ".tmp"
+            try:
+                with open(tmp, "wb") as f:
+                    data, validators = await http_get_json(client, url, params, stream_key=stream_key, tee=f, validators=validators)
+                if data is not NOT_MODIFIED:
+                    os.replace(tmp, path)
+                    fresh_cache_path.cache_clear()
+                    save_cache_validators(name, validators)
+            finally:
+                # Only left behind when the download failed part way
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+        if data is NOT_MODIFIED:
+            # Upstream is unchanged: restart the TTL and reuse what we have
+            os.utime(path)
+            fresh_cache_path.cache_clear()
+            data = load_local_json(path, stream_key)
         return data
     except Exception:
         # On failure, try stale cache
         stale_path = cache_path(name)
         if os.path.exists(stale_path):
-            with open(stale_path, "r") as f:
-                return json.load(f)
+            return load_local_json(stale_path, stream_key)
         # Then try optional local fallbacks
         if local_fallbacks:
             for p in local_fallbacks:
                 if os.path.exists(p):
-                    with open(p, "r") as f:
-                        data = json.load(f)
-                        # Save to cache for next time
-                        try:
-                            save_cache_json(name, data)
-                        except Exception:
-                            pass
-                        return data
+                    data = load_local_json(p, stream_key)
+                    # Save to cache for next time; the file is already JSON,
+                    # so copy its bytes rather than serializing data again
+                    try:
+                        ensure_cache_dir()
+                        tmp = path + ".tmp"
+                        shutil.copyfile(p, tmp)
+                        os.replace(tmp, path)
+                        fresh_cache_path.cache_clear()
+                        save_cache_validators(name, None)
+                    except Exception:
+                        pass
+                    return data
         raise
 
 
-def load_local_json(path: str):
-    with open(path, "r") as f:
-        return json.load(f)
+def load_local_json(path: str, stream_key: str | None = None):
+    with open(path, "rb") as f:
+        if stream_key is not None:
+            return list(ijson.items(f, stream_key, use_float=True))
+        if orjson is not None:
+            # Parse straight out of the page cache instead of copying the file
+            # into a bytes object first (the stdlib json can't take a buffer)
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                pass  # e.g. empty files can't be mapped
+            else:
+                with mm, memoryview(mm) as view:
+                    return orjson.loads(view)
+        return json_loads(f.read())
+
+
+def memoize_async(maxsize: int | None = None):
+    """LRU-memoize a coroutine function whose first argument is the HTTP client.
+
+    functools.lru_cache can't be used directly since it would hand out the same
+    (single-use) coroutine object. The client is not part of the key and
+    failures are not cached.
+    """
+
+    def decorator(fn):
+        results = {}
+
+        @functools.wraps(fn)
+        async def wrapper(client, *args):
+            if args in results:
+                # Re-insert to mark as most recently used
+                results[args] = results.pop(args)
+                return results[args]
+            result = await fn(client, *args)
+            results[args] = result
+            if maxsize is not None and len(results) > maxsize:
+                results.pop(next(iter(results)))
+            return result
+
+        wrapper.cache_clear = results.clear
+        return wrapper
+
+    return decorator
+
+
+SPECIALITY_CODE_KEYS = ("id", "code", "value", "key")
+SPECIALITY_NAME_KEYS = ("name", "description", "label")
+
+
+def first_key_with_value(item: dict, keys: tuple[str, ...]) -> str | None:
+    for key in keys:
+        if item.get(key):
+            return key
+    return None
+
+
+def first_value(item: dict, keys: tuple[str, ...]):
+    key = first_key_with_value(item, keys)
+    return item[key] if key is not None else None
 
 
-def fetch_specialities():
-    data = fetch_json_with_cache(
+@memoize_async()
+async def fetch_specialities(client: httpx.AsyncClient):
+    data = await fetch_json_with_cache(
+        client,
         name="specialities.json",
         url=URL_SPECIALITIES,
         params=None,
@@ -117,17 +322,23 @@ def fetch_specialities():
     )
     items = data.get("specialities") or data.get("items") or data
     result = []
-    if isinstance(items, list):
+    if isinstance(items, list) and items:
+        # All items share one schema in practice: find which keys the first
+        # item uses and only probe the alternatives for items lacking them
+        code_key = first_key_with_value(items[0], SPECIALITY_CODE_KEYS)
+        name_key = first_key_with_value(items[0], SPECIALITY_NAME_KEYS)
         for it in items:
-            code = it.get("id") or it.get("code") or it.get("value") or it.get("key")
-            name = it.get("name") or it.get("description") or it.get("label") or code
+            code = it.get(code_key) or first_value(it, SPECIALITY_CODE_KEYS)
+            name = it.get(name_key) or first_value(it, SPECIALITY_NAME_KEYS) or code
             if code and name:
                 result.append({"code": str(code).strip(), "name": str(name).strip()})
     return sorted(result, key=lambda x: x["name"].lower())
 
 
-def fetch_plans(cover_start: str):
-    data = fetch_json_with_cache(
+@memoize_async(maxsize=32)
+async def fetch_plans(client: httpx.AsyncClient, cover_start: str):
+    data = await fetch_json_with_cache(
+        client,
         name=f"plansummary_{cover_start}.json",
         url=URL_PLANSUMMARY,
         params={"coverStart": cover_start},
@@ -162,8 +373,10 @@ def fetch_plans(cover_start: str):
     return out
 
 
-def fetch_hospitals():
-    data = fetch_json_with_cache(
+@memoize_async()
+async def fetch_hospitals(client: httpx.AsyncClient):
+    data = await fetch_json_with_cache(
+        client,
         name="approved-hospitals.json",
         url=URL_HOSPITALS,
         params=None,
@@ -173,9 +386,17 @@ def fetch_hospitals():
     return hospitals
 
 
-def fetch_consultants_by_speciality(speciality_code: str):
+@memoize_async()
+async def hospitals_index(client: httpx.AsyncClient) -> dict:
+    hospitals = await fetch_hospitals(client)
+    return {h.get("id"): h for h in hospitals}
+
+
+@memoize_async(maxsize=32)
+async def fetch_consultants_by_speciality(client: httpx.AsyncClient, speciality_code: str):
     params = {"countyId": "", "hospitalId": "", "specialityId": speciality_code}
-    data = fetch_json_with_cache(
+    data = await fetch_json_with_cache(
+        client,
         name=f"consultants_{speciality_code.upper()}.json",
         url=URL_CONSULTANTS,
         params=params,
@@ -184,17 +405,37 @@ def fetch_consultants_by_speciality(speciality_code: str):
             f"consultants_{speciality_code.upper()}.json",
             "dermatologists.json" if speciality_code.upper() == "DERM" else "",
         ],
+        stream_key="consultants.item",
     )
-    return data.get("consultants") or data
+    return data
+
+
+@memoize_async()
+async def speciality_names_by_code(client: httpx.AsyncClient) -> dict:
+    specialities = await fetch_specialities(client)
+    return {it["code"].upper(): it["name"] for it in specialities}
+
+
+@memoize_async()
+async def speciality_codes_by_name(client: httpx.AsyncClient) -> dict:
+    specialities = await fetch_specialities(client)
+    return {it["name"].lower(): it["code"] for it in specialities}
+
+
+SLUG_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+SLUG_UNDERSCORES_RE = re.compile(r"_+")
 
 
 def slugify(s: str) -> str:
-    s = s.strip().lower()
-    s = re.sub(r"[^a-z0-9]+", "_", s)
-    s = re.sub(r"_+", "_", s).strip("_")
+    s = SLUG_NON_ALNUM_RE.sub("_", s.strip().lower())
+    s = SLUG_UNDERSCORES_RE.sub("_", s).strip("_")
     return s or "report"
 
 
+def default_pdf_name(spec_code: str, plan_name: str) -> str:
+    return f"consultants_{slugify(spec_code)}_{slugify(plan_name)}.pdf"
+
+
 def print_available_specialities(specialities: list[dict]):
     print("Available specialities:")
     for it in specialities:
@@ -207,24 +448,62 @@ def print_available_plans(plans: list[str]):
         print(f"- {name}")
 
 
-def build_pdf(consultants: list, hospitals: list, speciality_name: str, plan_name: str, out_path: str):
-    hospitals_dict = {h.get("id"): h for h in hospitals}
+# Same escaping as xml.sax.saxutils.escape, in a single pass over the string
+XML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+NA_TEXT = "N/A"
+
+# Styles are immutable once built, so share them between PDFs
+STYLES = getSampleStyleSheet()
+CELL_STYLE = ParagraphStyle(
+    name="Cell",
+    parent=STYLES["BodyText"],
+    fontSize=8,
+    leading=10,
+)
+TABLE_COL_WIDTHS = [0.7 * inch, 2.2 * inch, 0.8 * inch, 1.8 * inch, 4.5 * inch]
+# Table's default left + right cell padding
+TABLE_CELL_H_PADDING = 12
+TABLE_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 8),
+        ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
+        ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
+        # Name and hospitals cells may be plain strings or Paragraphs; give the
+        # plain ones CELL_STYLE's leading so both kinds line up
+        ("LEADING", (1, 1), (1, -1), CELL_STYLE.leading),
+        ("LEADING", (4, 1), (4, -1), CELL_STYLE.leading),
+        ("GRID", (0, 0), (-1, -1), 1, colors.black),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+        ("INNERGRID", (0, 0), (-1, -1), 0.25, colors.black),
+        ("BOX", (0, 0), (-1, -1), 0.25, colors.black),
+    ]
+)
+
 
+def plain_cell_text(text: str, col_width: float) -> str | None:
+    """Return text as a plain Table cell string if it fits on one line, else None.
+
+    Paragraph layout is far more expensive than a plain string cell and only
+    needed for wrapping or markup. Whitespace is normalized the way Paragraph
+    would render it.
+    """
+    text = " ".join(text.split())
+    if stringWidth(text, CELL_STYLE.fontName, CELL_STYLE.fontSize) <= col_width - TABLE_CELL_H_PADDING:
+        return text
+    return None
+
+
+def build_pdf(consultants: list, hospitals_dict: dict, speciality_name: str, plan_name: str, out_path: str):
     doc = SimpleDocTemplate(out_path, pagesize=landscape(letter))
     elements = []
 
-    styles = getSampleStyleSheet()
-    title_style = styles["Title"]
-    subtitle_style = styles["BodyText"]
-    cell_style = ParagraphStyle(
-        name="Cell",
-        parent=styles["BodyText"],
-        fontSize=8,
-        leading=10,
-    )
-
-    title = Paragraph(f"List of {speciality_name} Consultants", title_style)
-    sub = Paragraph(f"Plan: {plan_name}", subtitle_style)
+    title = Paragraph(f"List of {speciality_name} Consultants", STYLES["Title"])
+    sub = Paragraph(f"Plan: {plan_name}", STYLES["BodyText"])
     elements.append(title)
     elements.append(sub)
     elements.append(Spacer(1, 0.2 * inch))
@@ -236,61 +515,121 @@ def build_pdf(consultants: list, hospitals: list, speciality_name: str, plan_nam
         "Speciality Descriptions",
         "Associated Hospitals",
     ]
-    table_data = [headers]
 
-    for c in consultants:
-        assoc_lines = []
+    name_width = TABLE_COL_WIDTHS[1]
+    assoc_width = TABLE_COL_WIDTHS[4]
+
+    # Lookups are bound as defaults so the per-row work uses fast locals
+    def make_row(c, get_hospital=hospitals_dict.get, escape=XML_ESCAPE, cell_style=CELL_STYLE, paragraph=Paragraph, join="".join, plain=plain_cell_text):
+        # Collect markup fragments and join once per cell, one
+        # "name (county): phone<br/>" run per hospital
+        parts = []
+        extend = parts.extend
+        hospital_count = 0
+        # A single hospital without a (bold) phone can be a plain string cell
+        plain_assoc = None
         for hid in c.get("hospitals", []) or []:
-            h = hospitals_dict.get(hid)
+            h = get_hospital(hid)
             if h:
-                name = h.get("name", "Unknown")
-                county = h.get("county", "Unknown")
+                hospital_count += 1
+                # JSON strings are already str (or null); only the phone may be a number
+                name = h.get("name") or "Unknown"
+                county = h.get("county") or "Unknown"
                 phone_raw = h.get("phone") or h.get("phoneNo")
-                if phone_raw and str(phone_raw).strip():
-                    phone_markup = f"<b>{xml_escape(str(phone_raw))}</b>"
+                phone = str(phone_raw) if phone_raw else ""
+                extend((name.translate(escape), " (", county.translate(escape), "): "))
+                if phone.strip():
+                    extend(("<b>", phone.translate(escape), "</b>", "<br/>"))
                 else:
-                    phone_markup = "N/A"
-                assoc_lines.append(
-                    f"{xml_escape(str(name))} ({xml_escape(str(county))}): {phone_markup}"
-                )
-        assoc_html = "<br/>".join(assoc_lines) if assoc_lines else "N/A"
-        assoc_para = Paragraph(assoc_html, cell_style)
-
-        name_text = xml_escape(c.get("name", ""))
-        name_para = Paragraph(name_text, cell_style)
-        row = [
+                    extend((NA_TEXT, "<br/>"))
+                    if hospital_count == 1:
+                        plain_assoc = f"{name} ({county}): {NA_TEXT}"
+        if hospital_count == 0:
+            assoc_cell = NA_TEXT
+        elif hospital_count == 1 and plain_assoc is not None and (text := plain(plain_assoc, assoc_width)) is not None:
+            assoc_cell = text
+        else:
+            parts.pop()  # trailing <br/>
+            assoc_cell = paragraph(join(parts), cell_style)
+
+        name = c.get("name", "")
+        name_cell = plain(name, name_width)
+        if name_cell is None:
+            name_cell = paragraph(name.translate(escape), cell_style)
+
+        return [
             str(c.get("id", "")),
-            name_para,
+            name_cell,
             c.get("participating", ""),
             c.get("speciality_descriptions", ""),
-            assoc_para,
+            assoc_cell,
         ]
-        table_data.append(row)
-
-    col_widths = [0.7 * inch, 2.2 * inch, 0.8 * inch, 1.8 * inch, 4.5 * inch]
-    table = Table(table_data, colWidths=col_widths)
-    table_style = TableStyle(
-        [
-            ("BACKGROUND", (0, 0), (-1, 0), colors.grey),
-            ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-            ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-            ("FONTSIZE", (0, 0), (-1, -1), 8),
-            ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-            ("BACKGROUND", (0, 1), (-1, -1), colors.beige),
-            ("GRID", (0, 0), (-1, -1), 1, colors.black),
-            ("VALIGN", (0, 0), (-1, -1), "TOP"),
-            ("INNERGRID", (0, 0), (-1, -1), 0.25, colors.black),
-            ("BOX", (0, 0), (-1, -1), 0.25, colors.black),
-        ]
-    )
-    table.setStyle(table_style)
+
+    table_data = [headers, *map(make_row, consultants)]
+
+    table = Table(table_data, colWidths=TABLE_COL_WIDTHS)
+    table.setStyle(TABLE_STYLE)
     elements.append(table)
 
     doc.build(elements)
 
 
+# Set once per --all worker process by init_pdf_worker, so the hospitals index
+# isn't pickled along with every job
+worker_hospitals_dict: dict = {}
+
+
+def init_pdf_worker(hospitals_dict: dict):
+    global worker_hospitals_dict
+    worker_hospitals_dict = hospitals_dict
+
+
+def build_pdf_in_worker(consultants: list, speciality_name: str, plan_name: str, out_path: str):
+    build_pdf(consultants, worker_hospitals_dict, speciality_name, plan_name, out_path)
+
+
+async def build_all_pdfs(client: httpx.AsyncClient, specialities: list[dict], hospitals_dict: dict, plan_name: str, out_dir: str) -> bool:
+    # Consultant searches run concurrently (bounded so the API isn't hammered)
+    # and each PDF is rendered in a worker process as soon as its data arrives,
+    # so CPU-bound ReportLab work overlaps with the remaining downloads
+    os.makedirs(out_dir, exist_ok=True)
+    loop = asyncio.get_running_loop()
+    fetch_slots = asyncio.Semaphore(BATCH_FETCH_CONCURRENCY)
+
+    async def build_one(spec: dict, pool: ProcessPoolExecutor) -> str:
+        async with fetch_slots:
+            # Each speciality is fetched once here, so skip the memo rather
+            # than keep every consultants list alive after it is rendered
+            consultants = await fetch_consultants_by_speciality.__wrapped__(client, spec["code"])
+        out_path = os.path.join(out_dir, default_pdf_name(spec["code"], plan_name))
+        await loop.run_in_executor(pool, build_pdf_in_worker, consultants, spec["name"], plan_name, out_path)
+        return out_path
+
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        initializer=init_pdf_worker,
+        initargs=(hospitals_dict,),
+    ) as pool:
+        results = await asyncio.gather(
+            *(build_one(spec, pool) for spec in specialities),
+            return_exceptions=True,
+        )
+
+    all_ok = True
+    for spec, result in zip(specialities, results):
+        if isinstance(result, BaseException):
+            print(f"Failed to generate PDF for {spec['code']}: {result}")
+            all_ok = False
+        else:
+            print(f"PDF generated successfully: {result}")
+    return all_ok
+
+
 def main():
+    asyncio.run(amain())
+
+
+async def amain():
     parser = argparse.ArgumentParser(description="Generate Laya consultants PDF")
     parser.add_argument(
         "--plan",
@@ -298,11 +637,17 @@ def main():
         default="360 care select",
         help="Plan name (default: 360 care select)",
     )
-    parser.add_argument(
+    spec_group = parser.add_mutually_exclusive_group()
+    spec_group.add_argument(
         "--speciality",
         "-s",
         help="Speciality code or name (e.g. DERM or Dermatology)",
     )
+    spec_group.add_argument(
+        "--all",
+        action="store_true",
+        help="Generate a PDF for every speciality",
+    )
     parser.add_argument(
         "--cover-start",
         default=str(date.today()),
@@ -311,7 +656,7 @@ def main():
     parser.add_argument(
         "--output",
         "-o",
-        help="Output PDF path (default auto from speciality and plan)",
+        help="Output PDF path (default auto from speciality and plan); with --all, the output directory",
     )
 
     args = parser.parse_args()
@@ -320,58 +665,78 @@ def main():
     plan_arg_provided = any(a in sys.argv for a in ("--plan", "-p"))
     spec_arg_provided = any(a in sys.argv for a in ("--speciality", "-s"))
 
-    specialities = fetch_specialities()
-
-    if no_args:
-        parser.print_help()
-        print("")
-        plans = fetch_plans(args.cover_start)
-        print_available_plans(plans)
-        print("")
-        print_available_specialities(specialities)
-        return
-
-    # If speciality missing, list available specialities and exit
-    if not args.speciality:
-        print_available_specialities(specialities)
-        return
-
-    code_by_name = {it["name"].lower(): it["code"] for it in specialities}
-    name_by_code = {it["code"].upper(): it["name"] for it in specialities}
-
-    user_spec = args.speciality.strip()
-    if user_spec.upper() in name_by_code:
-        spec_code = user_spec.upper()
-        spec_name = name_by_code[spec_code]
-    else:
-        spec_code = code_by_name.get(user_spec.lower())
-        spec_name = user_spec
-    if not spec_code:
-        print("Unknown speciality. Choose one of:")
-        print_available_specialities(specialities)
+    # --all writes into a directory; reject a file path before fetching anything
+    if args.all and args.output and os.path.exists(args.output) and not os.path.isdir(args.output):
+        print(f"Output path is not a directory: {args.output}")
         sys.exit(1)
 
-    plans = fetch_plans(args.cover_start)
-    plan_name = args.plan.strip()
-    plan_lc = plan_name.lower()
-    matched_plan = None
-    for p in plans:
-        if p.lower() == plan_lc:
-            matched_plan = p
-            break
-    if matched_plan is None:
-        print("Unknown plan. Choose one of:")
-        print_available_plans(plans)
-        sys.exit(1)
-
-    hospitals = fetch_hospitals()
-    consultants = fetch_consultants_by_speciality(spec_code)
+    # One client for all requests: with HTTP/2 they share a single connection.
+    # Unlike urllib, httpx only follows redirects when asked to
+    async with httpx.AsyncClient(http2=True, follow_redirects=True, headers={"User-Agent": "laya-pdf/1.0"}) as client:
+        if no_args:
+            specialities, plans = await asyncio.gather(
+                fetch_specialities(client),
+                fetch_plans(client, args.cover_start),
+            )
+            parser.print_help()
+            print("")
+            print_available_plans(plans)
+            print("")
+            print_available_specialities(specialities)
+            return
+
+        # If speciality missing, list available specialities and exit
+        if not args.speciality and not args.all:
+            specialities = await fetch_specialities(client)
+            print_available_specialities(specialities)
+            return
+
+        # None of these depend on each other, fetch them concurrently
+        specialities, hospitals_dict, plans = await asyncio.gather(
+            fetch_specialities(client),
+            hospitals_index(client),
+            fetch_plans(client, args.cover_start),
+        )
+
+        if not args.all:
+            name_by_code = await speciality_names_by_code(client)
+
+            user_spec = args.speciality.strip()
+            if user_spec.upper() in name_by_code:
+                spec_code = user_spec.upper()
+                spec_name = name_by_code[spec_code]
+            else:
+                # Only needed when a name rather than a code was given
+                code_by_name = await speciality_codes_by_name(client)
+                spec_code = code_by_name.get(user_spec.lower())
+                spec_name = user_spec
+            if not spec_code:
+                print("Unknown speciality. Choose one of:")
+                print_available_specialities(specialities)
+                sys.exit(1)
+
+        plan_name = args.plan.strip()
+        # fetch_plans already de-duplicates case-insensitively
+        plans_by_lc = {p.lower(): p for p in plans}
+        matched_plan = plans_by_lc.get(plan_name.lower())
+        if matched_plan is None:
+            print("Unknown plan. Choose one of:")
+            print_available_plans(plans)
+            sys.exit(1)
+
+        if args.all:
+            all_ok = await build_all_pdfs(client, specialities, hospitals_dict, matched_plan, args.output or ".")
+            if not all_ok:
+                sys.exit(1)
+            return
+
+        consultants = await fetch_consultants_by_speciality(client, spec_code)
 
     out_path = args.output
     if not out_path:
-        out_path = f"consultants_{slugify(spec_code)}_{slugify(matched_plan)}.pdf"
+        out_path = default_pdf_name(spec_code, matched_plan)
 
-    build_pdf(consultants, hospitals, spec_name, matched_plan, out_path)
+    build_pdf(consultants, hospitals_dict, spec_name, matched_plan, out_path)
     print(f"PDF generated successfully: {out_path}")
 
 